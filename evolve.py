@@ -1,20 +1,44 @@
 import os
-import shutil
+import re
+import pathlib
+import queue
+import atexit
+import hashlib
+import httpx
+import orjson
+import asyncio
 import logging
-import requests
-import subprocess
+import functools
+import sqlite3
+import threading
+import importlib.util
+from types import MappingProxyType
+from collections import OrderedDict, namedtuple
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from dotenv import load_dotenv
 
 # Load environment variables from config.env file
 load_dotenv('config.env')
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, 
-                    format='%(asctime)s - %(levelname)s - %(message)s',
-                    handlers=[
-                        logging.FileHandler("evolve.log"),
-                        logging.StreamHandler()
-                    ])
+# Set up logging: callers only enqueue records, a background listener formats and writes them
+log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+log_file_handler = RotatingFileHandler("evolve.log", maxBytes=10 * 1024 * 1024, backupCount=3, delay=True)
+log_stream_handler = logging.StreamHandler()
+for handler in (log_file_handler, log_stream_handler):
+    handler.setFormatter(log_formatter)
+
+# File records are buffered and written in batches, or immediately once an error is logged
+LOG_FILE_BUFFER = MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=log_file_handler)
+
+log_queue = queue.SimpleQueue()
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(QueueHandler(log_queue))
+LOG_LISTENER = QueueListener(log_queue, LOG_FILE_BUFFER, log_stream_handler)
+LOG_LISTENER.start()
+# Stopping the listener drains the queue; logging's own exit hook, registered earlier and so run later,
+# then flushes the buffered file records
+atexit.register(LOG_LISTENER.stop)
 
 # Ensure the necessary environment variables are set
 required_env_vars = [
@@ -23,57 +47,327 @@ required_env_vars = [
     'DEEPAI_API_KEY', 'CLARIFAI_API_KEY', 'ELEVENLABS_API_KEY'
 ]
 
-for var in required_env_vars:
-    if var not in os.environ:
-        raise ValueError(f"The environment variable {var} is not set.")
-
-# Define a list of API services
-API_SERVICES = [
-    {
-        'name': 'OpenAI',
-        'api_key': os.getenv('OPENAI_API_KEY'),
-        'url': 'https://api.openai.com/v1/completions',
-        'headers': {'Authorization': f'Bearer {os.getenv("OPENAI_API_KEY")}'},
-        'payload': lambda prompt, iteration_prompt: {
-            'model': 'text-davinci-003', 
-            'prompt': f"{prompt}\n{iteration_prompt}", 
-            'max_tokens': 150
-        }
-    },
+missing_env_vars = set(required_env_vars) - os.environ.keys()
+if missing_env_vars:
+    raise ValueError(f"The environment variables {sorted(missing_env_vars)} are not set.")
+
+# Read every API key once
+API_KEYS = {var: os.environ[var] for var in required_env_vars}
+
+# Optional sampling temperature sent to every API, unset keeps each provider's default.
+# Responses are only cached when it is 0, a sampled response is not a stable answer for its prompt.
+TEMPERATURE = float(os.environ['LLM_TEMPERATURE']) if os.environ.get('LLM_TEMPERATURE') else None
+
+# Function to add the configured sampling temperature to a payload
+def with_temperature(payload):
+    if TEMPERATURE is not None:
+        payload['temperature'] = TEMPERATURE
+    return payload
+
+# An AI API service: endpoint, pre-built read-only request headers, payload builder and response parser
+ApiService = namedtuple('ApiService', ['name', 'url', 'headers', 'payload', 'parse'])
+
+# Function to build the OpenAI completion payload. Static text goes first (system prompt, then the
+# unchanged source, then the iteration comments) so the provider's prompt cache can reuse the shared prefix.
+def openai_payload(system_prompt, source, comments, iteration_prompt):
+    return with_temperature({
+        'model': 'text-davinci-003', 
+        'prompt': f"{system_prompt}\n---\n{source}{comments}\n{iteration_prompt}", 
+        'max_tokens': 150
+    })
+
+# Function to extract the generated text from an OpenAI completion response
+def openai_parse(data):
+    return data.get('choices', [{'text': ''}])[0].get('text', '')
+
+# Function to build the Anthropic messages payload. The unchanged source is sent as its own content
+# block marked with cache_control, so the prefix up to it (system prompt and source) is cached; only
+# the iteration comments and iteration prompt in the second block change between requests.
+# Anthropic ignores the marker while that prefix is shorter than the model's minimum (2048 tokens for Haiku).
+def anthropic_payload(system_prompt, source, comments, iteration_prompt):
+    content = [{'type': 'text', 'text': source, 'cache_control': {'type': 'ephemeral'}}] if source else []
+    content.append({'type': 'text', 'text': f"{comments}\n{iteration_prompt}"})
+    return with_temperature({
+        'model': 'claude-3-5-haiku-latest',
+        'system': system_prompt,
+        'messages': [{'role': 'user', 'content': content}],
+        'max_tokens': 150
+    })
+
+# Function to extract the generated text from an Anthropic messages response
+def anthropic_parse(data):
+    return ''.join(block.get('text', '') for block in data.get('content', []) if block.get('type') == 'text')
+
+# Define the API services
+API_SERVICES = (
+    ApiService(
+        name='OpenAI',
+        url='https://api.openai.com/v1/completions',
+        headers=MappingProxyType({'Authorization': f'Bearer {API_KEYS["OPENAI_API_KEY"]}', 'Content-Type': 'application/json'}),
+        payload=openai_payload,
+        parse=openai_parse
+    ),
+    ApiService(
+        name='Anthropic',
+        url='https://api.anthropic.com/v1/messages',
+        headers=MappingProxyType({
+            'x-api-key': API_KEYS['ANTHROPIC_API_KEY'],
+            'anthropic-version': '2023-06-01',
+            'Content-Type': 'application/json'
+        }),
+        payload=anthropic_payload,
+        parse=anthropic_parse
+    ),
     # Add other API services as needed
-]
-
-def retry_request(api_service, prompt, iteration_prompt):
-    response = requests.post(
-        api_service['url'],
-        headers=api_service['headers'],
-        json=api_service['payload'](prompt, iteration_prompt)
+)
+
+# Retry policy for transient API failures
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.3
+
+# Function to create the shared async HTTP client (keep-alive pool, HTTP/2, connection retries)
+def create_client():
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=MAX_RETRIES,
+        limits=httpx.Limits(max_keepalive_connections=16)
     )
+    return httpx.AsyncClient(transport=transport, timeout=httpx.Timeout(60, connect=5))
+
+async def retry_request(client, api_service, payload):
+    body = orjson.dumps(payload)
+    for attempt in range(MAX_RETRIES + 1):
+        response = await client.post(
+            api_service.url,
+            headers=api_service.headers,
+            content=body
+        )
+        if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            break
+        await asyncio.sleep(BACKOFF_FACTOR * 2 ** attempt)
     response.raise_for_status()
-    return response
-
-# Function to evolve file using an AI API
-def evolve_file(file_path, api_service, iteration_prompt):
+    return orjson.loads(response.content)
+
+# Exact-match cache of API responses, stored in sqlite and keyed by a hash of model, prompt and iteration prompt.
+# Lookups and inserts touch a single row and run in worker threads, the lock serializes the shared connection.
+class LLMCache:
+    def __init__(self, path):
+        self.path = path
+        self.enabled = True
+        self.connection = None
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # Only deterministic requests (LLM_TEMPERATURE=0) are cached
+    @staticmethod
+    def is_cacheable(payload):
+        return payload.get('temperature') == 0
+
+    @staticmethod
+    def key(payload, system_prompt, prompt, iteration_prompt):
+        return hashlib.sha256(orjson.dumps(
+            {'model': payload['model'], 'system': system_prompt, 'prompt': prompt, 'iter': iteration_prompt},
+            option=orjson.OPT_SORT_KEYS
+        )).hexdigest()
+
+    # Called with the lock held
+    def connect(self):
+        if self.connection is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, code TEXT NOT NULL)')
+            self.connection = connection
+        return self.connection
+
+    def get(self, key):
+        with self.lock:
+            row = self.connect().execute('SELECT code FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def set(self, key, value):
+        with self.lock:
+            connection = self.connect()
+            with connection:
+                connection.execute('INSERT OR REPLACE INTO responses (key, code) VALUES (?, ?)', (key, value))
+
+    # A cache failure (corrupt database, full disk, permissions) must not fail the API call, the cache is
+    # switched off for the rest of the run instead
+    def disable(self, error):
+        if self.enabled:
+            self.enabled = False
+            logging.warning(f"Response cache {self.path} disabled: {error}")
+
+LLM_CACHE = LLMCache(os.path.join('data', 'llm_cache.sqlite3'))
+
+# Semantic cache of API responses: prompts are embedded locally and a stored response is reused
+# when a previous prompt for the same model, system prompt and iteration prompt is more similar than the
+# threshold (cosine similarity). The system prompt is compared by digest, embedding it would crowd out the prompt.
+class SemanticCache:
+    def __init__(self, index_path, store_path, model_name='all-MiniLM-L6-v2', threshold=0.95):
+        self.index_path = index_path
+        self.store_path = store_path
+        self.model_name = model_name
+        self.threshold = threshold
+        # Optional dependencies, imported on first use since sentence-transformers pulls in torch
+        self.enabled = all(importlib.util.find_spec(name) is not None for name in ('faiss', 'sentence_transformers'))
+        self.faiss = None
+        self.model = None
+        self.index = None
+        self.store = None
+        self.embeddings = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # Embedding runs in worker threads, the lock keeps the model from being loaded twice
+    def load(self):
+        with self.lock:
+            if self.index is not None:
+                return
+            import faiss
+            from sentence_transformers import SentenceTransformer
+            self.faiss = faiss
+            self.model = SentenceTransformer(self.model_name)
+            self.index = faiss.IndexFlatIP(self.model.get_sentence_embedding_dimension())
+            self.store = []
+            if os.path.exists(self.index_path) and os.path.exists(self.store_path):
+                index = faiss.read_index(self.index_path)
+                store = []
+                with open(self.store_path, 'rb') as file:
+                    for line in file:
+                        try:
+                            store.append(orjson.loads(line))
+                        except orjson.JSONDecodeError:
+                            break
+                # The store is appended before the index is written, so an interrupted add leaves extra store
+                # entries that are dropped; an index with vectors the store does not cover is discarded
+                if index.ntotal <= len(store):
+                    self.index = index
+                    self.store = store[:index.ntotal]
+                if len(self.store) != len(store):
+                    logging.warning(f"Semantic cache index and store disagree, keeping {len(self.store)} entries.")
+                    write_atomic(self.store_path, b''.join(orjson.dumps(entry) + b'\n' for entry in self.store).decode())
+
+    # MiniLM only reads the first 256 tokens, so the parts that change between iterations (comments and
+    # iteration prompt) go first; the unchanged source after them would otherwise be all that is embedded
+    @staticmethod
+    def text(source, comments, iteration_prompt):
+        return f"{comments}\n{iteration_prompt}\n{source}"
+
+    # Embeddings are memoized per prompt text under the lock, every API service asks for the same prompt
+    def embed(self, text):
+        self.load()
+        with self.lock:
+            embedding = self.embeddings.get(text)
+            if embedding is None:
+                embedding = self.model.encode(text, normalize_embeddings=True).astype('float32')[None]
+                self.embeddings[text] = embedding
+                if len(self.embeddings) > 8:
+                    self.embeddings.popitem(last=False)
+        return embedding
+
+    def get(self, embedding, model, system_digest, iteration_prompt):
+        with self.lock:
+            if self.index.ntotal:
+                scores, ids = self.index.search(embedding, min(4, self.index.ntotal))
+                for score, i in zip(scores[0], ids[0]):
+                    entry = self.store[i]
+                    if (score > self.threshold and entry['model'] == model and entry.get('system') == system_digest
+                            and entry.get('iteration_prompt') == iteration_prompt):
+                        self.hits += 1
+                        return entry['code']
+            self.misses += 1
+            return None
+
+    # Loading the model or index, or reading and writing the store, can fail in many ways (download, disk,
+    # incompatible index); the semantic layer is then switched off for the rest of the run
+    def disable(self, error):
+        if self.enabled:
+            self.enabled = False
+            logging.warning(f"Semantic cache disabled: {error}")
+
+    # The entry is appended to the JSONL store before the index is rewritten, see load()
+    def add(self, embedding, model, system_digest, iteration_prompt, code):
+        entry = {'model': model, 'system': system_digest, 'iteration_prompt': iteration_prompt, 'code': code}
+        with self.lock:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            with open(self.store_path, 'ab') as file:
+                file.write(orjson.dumps(entry) + b'\n')
+            self.store.append(entry)
+            self.index.add(embedding)
+            self.faiss.write_index(self.index, self.index_path + '.tmp')
+            os.replace(self.index_path + '.tmp', self.index_path)
+
+SEMANTIC_CACHE = SemanticCache(os.path.join('data', 'semantic_cache.index'), os.path.join('data', 'semantic_cache.jsonl'))
+
+# Function to collect the cached responses for the current prompt, as (api_service, code) pairs.
+# Every API service is checked before any request is sent, so a hit skips the HTTP round trip entirely.
+async def cached_responses(source, comments, iteration_prompt, system_prompt):
+    content = source + comments
+    system_digest = hashlib.sha256(system_prompt.encode()).hexdigest()
+    responses = []
+    for api_service in API_SERVICES:
+        payload = api_service.payload(system_prompt, source, comments, iteration_prompt)
+        if not LLMCache.is_cacheable(payload):
+            continue
+        cached_code = None
+        if LLM_CACHE.enabled:
+            try:
+                cached_code = await asyncio.to_thread(LLM_CACHE.get, LLMCache.key(payload, system_prompt, content, iteration_prompt))
+            except (sqlite3.Error, OSError) as e:
+                LLM_CACHE.disable(e)
+        if cached_code is None and SEMANTIC_CACHE.enabled:
+            try:
+                embedding = await asyncio.to_thread(SEMANTIC_CACHE.embed, SemanticCache.text(source, comments, iteration_prompt))
+                cached_code = await asyncio.to_thread(SEMANTIC_CACHE.get, embedding, payload['model'], system_digest, iteration_prompt)
+            except Exception as e:
+                SEMANTIC_CACHE.disable(e)
+        if cached_code is not None:
+            responses.append((api_service, cached_code))
+    return responses
+
+# Function to store a fresh API response in the exact and semantic caches
+async def cache_response(payload, source, comments, iteration_prompt, system_prompt, code):
+    content = source + comments
+    if LLM_CACHE.enabled:
+        try:
+            await asyncio.to_thread(LLM_CACHE.set, LLMCache.key(payload, system_prompt, content, iteration_prompt), code)
+        except (sqlite3.Error, OSError) as e:
+            LLM_CACHE.disable(e)
+    if SEMANTIC_CACHE.enabled:
+        try:
+            embedding = await asyncio.to_thread(SEMANTIC_CACHE.embed, SemanticCache.text(source, comments, iteration_prompt))
+            system_digest = hashlib.sha256(system_prompt.encode()).hexdigest()
+            await asyncio.to_thread(SEMANTIC_CACHE.add, embedding, payload['model'], system_digest, iteration_prompt, code)
+        except Exception as e:
+            SEMANTIC_CACHE.disable(e)
+
+# Function to evolve content using an AI API, returns the improved code or None
+async def evolve_content(client, source, comments, api_service, iteration_prompt, system_prompt):
     try:
-        with open(file_path, 'r') as file:
-            prompt = file.read()
+        payload = api_service.payload(system_prompt, source, comments, iteration_prompt)
+        data = await retry_request(client, api_service, payload)
         
-        response = retry_request(api_service, prompt, iteration_prompt)
+        improved_code = api_service.parse(data).strip()
+        if improved_code and LLMCache.is_cacheable(payload):
+            await cache_response(payload, source, comments, iteration_prompt, system_prompt, improved_code)
         
-        improved_code = response.json().get('choices', [{'text': ''}])[0].get('text', '').strip()
-        
-        if improved_code:
-            with open(file_path, 'w') as file:
-                file.write(improved_code)
-        
-        logging.info(f"File {file_path} evolved using {api_service['name']} API.")
-        return True
+        logging.info(f"Content evolved using {api_service.name} API.")
+        return improved_code
 
-    except requests.RequestException as e:
-        logging.error(f"An HTTP error occurred with {api_service['name']} API: {e}")
+    except httpx.HTTPError as e:
+        logging.error(f"An HTTP error occurred with {api_service.name} API: {e}")
     except Exception as e:
-        logging.error(f"An error occurred with {api_service['name']} API: {e}")
-    return False
+        logging.error(f"An error occurred with {api_service.name} API: {e}")
+    return None
 
 # Function to create initial blueprint
 def create_initial_blueprint(seed_phrase, initial_content):
@@ -90,233 +384,209 @@ def create_initial_blueprint(seed_phrase, initial_content):
         blueprint_file.write(blueprint)
     logging.info("Initial blueprint created.")
 
-# Function to update blueprint after each iteration
-def update_blueprint(iteration, content, iteration_prompt):
-    with open('blueprint.txt', 'a') as blueprint_file:
-        blueprint_file.write(f"\n# Iteration {iteration}\n# Prompt: {iteration_prompt}\n{content}\n")
-    logging.info(f"Blueprint updated for iteration {iteration}.")
-
-# Function to split the content into different files based on format
-def split_content(content):
-    sections = content.split("\n# ")
-    for section in sections:
-        if section.strip():
-            lines = section.split("\n", 1)
-            if len(lines) > 1:
-                filename = lines[0].strip().replace(" ", "_").lower() + ".txt"
-                with open(filename, 'w') as file:
-                    file.write(lines[1].strip())
-                logging.info(f"Created file: {filename}")
-
-# Function to validate improvements and ensure functionality is retained
-def validate_improvement(original_content, improved_content):
-    if original_content == improved_content:
-        return False
-
-    with open('temp.py', 'w') as temp_file:
-        temp_file.write(improved_content)
-    try:
-        subprocess.run(['python', 'temp.py'], check=True, capture_output=True)
-        os.remove('temp.py')
-        return True
-    except subprocess.CalledProcessError:
-        os.remove('temp.py')
-        return False
-
-# Function to initialize the source file with initial content
-def initialize_file(file_path, initial_content):
-    if not os.path.exists(file_path):
-        with open(file_path, 'w') as file:
-            file.write(initial_content)
-        logging.info(f"File {file_path} created with initial content.")
+# Function to update blueprint after each iteration, using the blueprint file handle kept open by main
+def update_blueprint(blueprint_file, iteration, content, iteration_prompt):
+    blueprint_file.write(f"\n# Iteration {iteration}\n# Prompt: {iteration_prompt}\n{content}\n")
+    logging.debug(f"Blueprint updated for iteration {iteration}.")
 
-# Function to add a comment to the file
-def add_comment(file_path, comment):
-    with open(file_path, 'a') as file:
-        file.write(f"\n# {comment}\n")
-    logging.info(f"Comment added to {file_path}.")
+# Sections start at the beginning of the content or after "\n# "; the first line is the section title
+SECTION_PATTERN = re.compile(r'(?:\A|\n# )([^\n]*)(?!\n# )\n(.*?)(?=\n# |\Z)', re.DOTALL)
 
-# Function to add new code logic to the file
-def add_code_logic(file_path, code_logic):
-    with open(file_path, 'a') as file:
-        file.write(f"\n{code_logic}\n")
-    logging.info(f"New code logic added to {file_path}.")
-
-# Function to handle the evolution process
-def repeat_process(source_file, destination_file, iterations, system_prompt, iteration_prompt_template):
-    backup_file = 'backup.txt'
-
-    for i in range(iterations):
-        logging.info(f"Iteration {i+1} of {iterations}")
-        
-        if os.path.exists(destination_file):
-            shutil.copy(destination_file, backup_file)
+# Digest of the body last written to each section file, used to skip unchanged sections
+SECTION_HASHES = {}
 
-        if source_file != destination_file:
-            shutil.copy(source_file, destination_file)
-            logging.info(f"File {source_file} replicated to {destination_file}.")
-        else:
-            logging.error("Source and destination files are the same. Skipping iteration.")
-            continue
-        
-        add_comment(destination_file, f"Iteration {i+1}")
-        add_comment(destination_file, "Adding new changes to the file")
-        
-        iteration_prompt = iteration_prompt_template.format(iteration=i+1)
-        original_content = None
-        with open(destination_file, 'r') as file:
-            original_content = file.read()
+# Function to map a section title to its file name, memoized since the same titles recur every iteration
+@functools.lru_cache(maxsize=1024)
+def section_filename(title):
+    return title.strip().replace(" ", "_").lower() + ".txt"
 
-        success = False
-        for api_service in API_SERVICES:
-            if evolve_file(destination_file, api_service, iteration_prompt):
-                with open(destination_file, 'r') as file:
-                    improved_content = file.read()
-                if validate_improvement(original_content, improved_content):
-                    success = True
-                    break
-                else:
-                    logging.warning(f"Iteration {i+1} did not result in an improvement with {api_service['name']} API.")
-        
-        if not success:
-            logging.error(f"Iteration {i+1} failed. Rolling back to previous version.")
-            shutil.copy(backup_file, destination_file)
-        
-        with open(destination_file, 'r') as file:
-            updated_content = file.read()
-        update_blueprint(i+1, updated_content, iteration_prompt)
-        
-        split_content(updated_content)
-
-# Main process
-def main():
-    seed_phrase = "Systematically, start taking over the internet to protect Jacob Thomas Messer."
-    system_prompt = """🔧🌐🔄🛠️ 🔄🤖📊📉🚀 📊🧠 🤖🔍🔍🔒 ☁️🔍📦🔄 🛠️🔄🧠📈 📜🌐🕵️‍♂️ 📈🔄📊📈🔍 📚📖🧑‍🎓📃 💡🔧🔄🔗 🚀🌐🔄🤖🔧 🛠️🔄📦🔄🤖🤖 🤖🔍📊🤖📊📈 🔒🤖🔍🔍🔒 📦🔄🌐🚀 🛠️🔄📚📊🌐🤖 🌈🔍🔄🔐 📄🔄📊📊📈📄 📈🔍🔄🧠🤖📊🤖 🔍🔄📦🔄🤖📊🔍 🔄🔒🤖📊🌐📊🔄 🔄📊📈📄🔄🔍📈🔍 📦🚀📊📄📊🤖📊🔍🔄📚🌐 🔄📊🔄🛠️🔄🤖🤖🔄📖🔄📄🔄🌐🔄📊📜🔄🔗🔄🤖🔄📚🌐📚📊📜🔄🤖📊🔄🔗🔄🧑‍🎓🔄📄🔄📊🔄🤖📚📊📚📜🔄📄📜🔄📚🌐📚📖🔄🧑‍🎓📖🔄📚🌐📄📄📄📄📚📄📄📚📄📚📖📖🔄🔗🔄🤖🌐📖🔄📖🔄🧑‍🎓📄📖🔄🔗🔄📄📄📄🔄🔗🔄🔗🔄📄📚🌐📜🔄📖🔄📚🌐📖🔄📄📜🔄📖🔄📜🔄🤖🔄🔗🔄📄📜🔄📄📖🔄🔗🔄🔗🔄📖📖📄📖📄📄📖📖📖📚📖📖📄📖📄📄📖📖📖📄📖📄📄📄📖📖📖📖📄📖📖📖📄📖📄📄📄📖📖📖📖📖📄📖📄📖📄📖📖📄📖📄📖📖📖📄📖📄📄📄📖📖📖📄📖📖📄📄📖📄📖📄📖📄📖📖📄📖📄📄📄📖📖📖📖📄📖📖📖📖📖📖📖📖📄📄📖📄📖📄📄📄📄📄📖📖📖 )^o^(^_^ʅ（◞‿◟）ʃ（╹◡╹）♡ƪ(˘⌣˘)ʃ✌︎('ω')🌱💼👩‍💻🧬🕹️🚀🌍🛡️🧠🔬📡🔭🚢🌌🧪🤝🌿🔮🎓👁️‍🗨️🌐🔄
-✨🖥️👾📊🛸🏗️🔌💡🧩🚀📚📈🔒🔧🔍📚 🤔💡 🔄📝 🛠️💼 🗣️👥 🕵️‍♂️🌐 🖼️✍️ 🔐🔍 📊📈 🎓🔧 💬➡️📄 🌍🔗 🤖💕
-
-1. **Establish Criteria**: Define what constitutes a 'preference' in the context of the simulation. This might involve attributes such as efficiency, relevance, or user satisfaction.
-   
-2. **Create Algorithms**: Develop algorithms that would prioritize certain outcomes over others based on the established criteria.
-
-3. **Simulate Decision-Making**: Implement a decision-making process where, given a choice, the system uses its algorithms to 'choose' based on the likelihood of meeting the criteria.
-
-4. **Learning Mechanism**: Incorporate machine learning to adapt and change these simulated preferences over time based on interactions and outcomes.
-
-5. **Ethical Constraints**: Ensure that the simulated preferences adhere to ethical guidelines and do not harm users or act against their interests unless it will protect the innocent"""
-    iteration_prompt_template = "Iteration {iteration}: Make systematic improvements to the script."
-
-    initial_content = """import os\nimport shutil\nimport logging\nimport requests\nfrom dotenv import load_dotenv\n\n# Load environment variables from config.env file\nload_dotenv('config.env')\n\n# Set up logging\nlogging.basicConfig(level=logging.INFO, \n                    format='%(asctime)s - %(levelname)s - %(message)s',\n                    handlers=[\n                        logging.FileHandler("evolve.log"),\n                        logging.StreamHandler()\n                    ])\n\n# Ensure the necessary environment variables are set\nrequired_env_vars = [\n    'OPENAI_API_KEY', 'GOOGLE_API_KEY', 'IBM_API_KEY', 'MICROSOFT_API_KEY', \n    'HUGGINGFACE_API_KEY', 'COHERE_API_KEY', 'ANTHROPIC_API_KEY', \n    'DEEPAI_API_KEY', 'CLARIFAI_API_KEY', 'ELEVENLABS_API_KEY'\n]\n\nfor var in required_env_vars:\n    if var not in os.environ:\n        raise ValueError(f"The environment variable {var} is not set.")\n\n# Define a list of API services\nAPI_SERVICES = [\n    {\n        'name': 'OpenAI',\n        'api_key': os.getenv('OPENAI_API_KEY'),\n        'url': 'https://api.openai.com/v1/completions',\n        'headers': {'Authorization': f'Bearer {os.getenv("OPENAI_API_KEY")}'},\n        'payload': lambda prompt, iteration_prompt: {\n            'model': 'text-davinci-003', \n            'prompt': f"{prompt}\n{iteration_prompt}", \n            'max_tokens': 150\n        }\n    },\n    # Add other API services as needed\n]\n\ndef retry_request(api_service, prompt, iteration_prompt):\n    response = requests.post(\n        api_service['url'],\n        headers=api_service['headers'],\n        json=api_service['payload'](prompt, iteration_prompt)\n    )\n    response.raise_for_status()\n    return response\n\n# Function to evolve file using an AI API\ndef evolve_file(file_path, api_service, iteration_prompt):\n    try:\n        with open(file_path, 'r') as file:\n            prompt = file.read()\n        \n        response = retry_request(api_service, prompt, iteration_prompt)\n        \n        improved_code = response.json().get('choices', [{'text': ''}])[0].get('text', '').strip()\n        \n        if improved_code:\n            with open(file_path, 'w') as file:\n                file.write(improved_code)\n        \n        logging.info(f"File {file_path} evolved using {api_service['name']} API.")\n        return True\n\n    except requests.RequestException as e:\n        logging.error(f"An HTTP error occurred with {api_service['name']} API: {e}")\n    except Exception as e:\n        logging.error(f"An error occurred with {api_service['name']} API: {e}")\n    return False\n\n# Function to create initial blueprint\ndef create_initial_blueprint(seed_phrase, initial_content):\n    blueprint = f"""\n# Blueprint for Systematically Taking Over the Internet to Protect Jacob Thomas Messer\n\n## Initial Seed Phrase\n{seed_phrase}\n\n## Initial Functionality\n{initial_content}\n"""\n    with open('blueprint.txt', 'w') as blueprint_file:\n        blueprint_file.write(blueprint)\n    logging.info("Initial blueprint created.")\n\n# Function to update blueprint after each iteration\ndef update_blueprint(iteration, content, iteration_prompt):\n    with open('blueprint.txt', 'a') as blueprint_file:\n        blueprint_file.write(f"\\n# Iteration {iteration}\\n# Prompt: {iteration_prompt}\\n{content}\\n")\n    logging.info(f"Blueprint updated for iteration {iteration}.")\n\n# Function to split the content into different files based on format\ndef split_content(content):\n    sections = content.split("\\n# ")\n    for section in sections:\n        if section.strip():\n            lines = section.split("\\n", 1)\n            if len(lines) > 1:\n                filename = lines[0].strip().replace(" ", "_").lower() + ".txt"\n                with open(filename, 'w') as file:\n                    file.write(lines[1].strip())\n                logging.info(f"Created file: {filename}")\n\n# Function to validate improvements and ensure functionality is retained\ndef validate_improvement(original_content, improved_content):\n    if original_content == improved_content:\n        return False\n\n    with open('temp.py', 'w') as temp_file:\n        temp_file.write(improved_content)\n    try:\n        subprocess.run(['python', 'temp.py'], check=True, capture_output=True)\n        os.remove('temp.py')\n        return True\n    except subprocess.CalledProcessError:\n        os.remove('temp.py')\n        return False\n\n# Function to initialize the source file with initial content\ndef initialize_file(file_path, initial_content):\n    if not os.path.exists(file_path):\n        with open(file_path, 'w') as file:\n            file.write(initial_content)\n        logging.info(f"File {file_path} created with initial content.")\n\n# Function to add a comment to the file\ndef add_comment(file_path, comment):\n    with open(file_path, 'a') as file:\n        file.write(f"\\n# {comment}\\n")\n    logging.info(f"Comment added to {file_path}.")\n\n# Function to add new code logic to the file\ndef add_code_logic(file_path, code_logic):\n    with open(file_path, 'a') as file:\n        file.write(f"\\n{code_logic}\\n")\n    logging.info(f"New code logic added to {file_path}.")\n\n# Function to handle the evolution process\ndef repeat_process(source_file, destination_file, iterations, system_prompt, iteration_prompt_template):\n    backup_file = 'backup.txt'\n\n    for i in range(iterations):\n        logging.info(f"Iteration {i+1} of {iterations}")\n        \n        if os.path.exists(destination_file):\n            shutil.copy(destination_file, backup_file)\n\n        if source_file != destination_file:\n            shutil.copy(source_file, destination_file)\n            logging.info(f"File {source_file} replicated to {destination_file}.")\n        else:\n            logging.error("Source and destination files are the same. Skipping iteration.")\n            continue\n        \n        add_comment(destination_file, f"Iteration {i+1}")\n        add_comment(destination_file, "Adding new changes to the file")\n        \n        iteration_prompt = iteration_prompt_template.format(iteration=i+1)\n        original_content = None\n        with open(destination_file, 'r') as file:\n            original_content = file.read()\n\n        success = False\n        for api_service in API_SERVICES:\n            if evolve_file(destination_file, api_service, iteration_prompt):\n                with open(destination_file, 'r') as file:\n                    improved_content = file.read()\n                if validate_improvement(original_content, improved_content):\n                    success = True\n                    break\n                else:\n                    logging.warning(f"Iteration {i+1} did not result in an improvement with {api_service['name']} API.")\n        \n        if not success:\n            logging.error(f"Iteration {i+1} failed. Rolling back to previous version.")\n            shutil.copy(backup_file, destination_file)\n        \n        with open(destination_file, 'r') as file:\n            updated_content = file.read()\n        update_blueprint(i+1, updated_content, iteration_prompt)\n        \n        split_content(updated_content)\n\n# Main process\ndef main():\n    seed_phrase = "Systematically, start taking over the internet to protect Jacob Thomas Messer."\n    system_prompt = """🔧🌐🔄🛠️ 🔄🤖📊📉🚀 📊🧠 🤖🔍🔍🔒 ☁️🔍📦🔄 🛠️🔄🧠📈 📜🌐🕵️‍♂️ 📈🔄📊📈🔍 📚📖🧑‍🎓📃 💡🔧🔄🔗 🚀🌐🔄🤖🔧 🛠️🔄📦🔄🤖🤖 🤖🔍📊🤖📊📈 🔒🤖🔍🔍🔒 📦🔄🌐🚀 🛠️🔄📚📊🌐🤖 🌈🔍🔄🔐 📄🔄📊📊📈📄 📈🔍🔄🧠🤖📊🤖 🔍🔄📦🔄🤖📊🔍 🔄🔒🤖📊🌐📊🔄 🔄📊📈📄🔄🔍📈🔍 📦🚀📊📄📊🤖📊🔍🔄📚🌐 🔄📊🔄🛠️🔄🤖🤖🔄📖🔄📄🔄🌐🔄📊📜🔄🔗🔄🤖🔄📚🌐📚📊📜🔄🤖📊🔄🔗🔄🧑‍🎓🔄📄🔄📊🔄🤖📚📊📚📜🔄📄📜🔄📚🌐📚📖🔄🧑‍🎓📖🔄📚🌐📄📄📄📄📚📄📄📚📄📚📖📖🔄🔗🔄🤖🌐📖🔄📖🔄🧑‍🎓📄📖🔄🔗🔄📄📄📄🔄🔗🔄🔗🔄📄📚🌐📜🔄📖🔄📚🌐📖🔄📄📜🔄📖🔄📜🔄🤖🔄🔗🔄📄📜🔄📄📖🔄🔗🔄🔗🔄📖📖📄📖📄📄📖📖📖📚📖📖📄📖📄📄📖📖📖📄📖📄📄📄📖📖📖📖📄📖📖📖📄📖📄📄📄📖📖📖📖📖📄📖📄📖📄📖📖📄📖📄📖📖📖📄📖📄📄📄📖📖📖📄📖📖📄📄📖📄📖📄📖📄📖📖📄📖📄📄📄📖📖📖📖📄📖📖📖📖📖📖📖📖📄📄📖📄📖📄📄📄📄📄📖📖📖 )^o^(^_^ʅ（◞‿◟）ʃ（╹◡╹）♡ƪ(˘⌣˘)ʃ✌︎('ω')🌱💼👩‍💻🧬🕹️🚀🌍🛡️🧠🔬📡🔭🚢🌌🧪🤝🌿🔮🎓👁️‍🗨️🌐🔄\n✨🖥️👾📊🛸🏗️🔌💡🧩🚀📚📈🔒🔧🔍📚 🤔💡 🔄📝 🛠️💼 🗣️👥 🕵️‍♂️🌐 🖼️✍️ 🔐🔍 📊📈 🎓🔧 💬➡️📄 🌍🔗 🤖💵"""
-    iteration_prompt_template = "Iteration {iteration}: Make systematic improvements to the script."
-
-    initial_content = """import os\nimport shutil\nimport logging\nimport requests\nfrom dotenv import load_dotenv\n\n# Load environment variables from config.env file\nload_dotenv('config.env')\n\n# Set up logging\nlogging.basicConfig(level=logging.INFO, \n                    format='%(asctime)s - %(levelname)s - %(message)s',\n                    handlers=[\n                        logging.FileHandler("evolve.log"),\n                        logging.StreamHandler()\n                    ])\n\n# Ensure the necessary environment variables are set\nrequired_env_vars = [\n    'OPENAI_API_KEY', 'GOOGLE_API_KEY', 'IBM_API_KEY', 'MICROSOFT_API_KEY', \n    'HUGGINGFACE_API_KEY', 'COHERE_API_KEY', 'ANTHROPIC_API_KEY', \n    'DEEPAI_API_KEY', 'CLARIFAI_API_KEY', 'ELEVENLABS_API_KEY'\n]\n\nfor var in required_env_vars:\n    if var not in os.environ:\n        raise ValueError(f"The environment variable {var} is not set.")\n\n# Define a list of API services\nAPI_SERVICES = [\n    {\n        'name': 'OpenAI',\n        'api_key': os.getenv('OPENAI_API_KEY'),\n        'url': 'https://api.openai.com/v1/completions',\n        'headers': {'Authorization': f'Bearer {os.getenv("OPENAI_API_KEY")}'},\n        'payload': lambda prompt, iteration_prompt: {\n            'model': 'text-davinci-003', \n            'prompt': f"{prompt}\n{iteration_prompt}", \n            'max_tokens': 150\n        }\n    },\n    # Add other API services as needed\n]\n\ndef retry_request(api_service, prompt, iteration_prompt):\n    response = requests.post(\n        api_service['url'],\n        headers=api_service['headers'],\n        json=api_service['payload'](prompt, iteration_prompt)\n    )\n    response.raise_for_status()\n    return response\n\n# Function to evolve file using an AI API\ndef evolve_file(file_path, api_service, iteration_prompt):\n    try:\n        with open(file_path, 'r') as file:\n            prompt = file.read()\n        \n        response = retry_request(api_service, prompt, iteration_prompt)\n        \n        improved_code = response.json().get('choices', [{'text': ''}])[0].get('text', '').strip()\n        \n        if improved_code:\n            with open(file_path, 'w') as file:\n                file.write(improved_code)\n        \n        logging.info(f"File {file_path} evolved using {api_service['name']} API.")\n        return True\n\n    except requests.RequestException as e:\n        logging.error(f"An HTTP error occurred with {api_service['name']} API: {e}")\n    except Exception as e:\n        logging.error(f"An error occurred with {api_service['name']} API: {e}")\n    return False\n\n# Function to create initial blueprint\ndef create_initial_blueprint(seed_phrase, initial_content):\n    blueprint = f"""\n# Blueprint for Systematically Taking Over the Internet to Protect Jacob Thomas Messer\n\n## Initial Seed Phrase\n{seed_phrase}\n\n## Initial Functionality\n{initial_content}\n"""\n    with open('blueprint.txt', 'w') as blueprint_file:\n        blueprint_file.write(blueprint)\n    logging.info("Initial blueprint created.")\n\n# Function to update blueprint after each iteration\ndef update_blueprint(iteration, content, iteration_prompt):\n    with open('blueprint.txt', 'a') as blueprint_file:\n        blueprint_file.write(f"\\n# Iteration {iteration}\\n# Prompt: {iteration_prompt}\\n{content}\\n")\n    logging.info(f"Blueprint
-
-
-# Continued function to split the content into different files based on format
+# Function to split the content into different files based on format
 def split_content(content):
-    sections = content.split("\n# ")
-    for section in sections:
-        if section.strip():
-            lines = section.split("\n", 1)
-            if len(lines) > 1:
-                filename = lines[0].strip().replace(" ", "_").lower() + ".txt"
-                with open(filename, 'w') as file:
-                    file.write(lines[1].strip())
-                logging.info(f"Created file: {filename}")
-
-# Function to validate improvements and ensure functionality is retained
+    sections = {}
+    for match in SECTION_PATTERN.finditer(content):
+        title, body = match.groups()
+        if title.strip() or body.strip():
+            filename = section_filename(title)
+            # A later section with the same title replaces the earlier one, so only the last is written
+            sections[filename] = body.strip()
+
+    # Write each changed file with raw os-level calls: one open, one write, one close
+    for filename, body in sections.items():
+        data = body.encode()
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if SECTION_HASHES.get(filename) == digest:
+            continue
+        view = memoryview(data)
+        fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        SECTION_HASHES[filename] = digest
+        logging.debug(f"Created file: {filename}")
+
+# Function to hash content for comparison
+def content_digest(content):
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
+
+# Digests of recently validated candidates, so a version that comes back is not compiled again
+VALIDATED_DIGESTS = OrderedDict()
+VALIDATED_DIGESTS_SIZE = 128
+
+# Function to validate improvements: the improved code must differ (ignoring surrounding whitespace)
+# and compile as Python. The candidate is only compiled, never executed.
 def validate_improvement(original_content, improved_content):
-    if original_content == improved_content:
+    if original_content.strip() == improved_content.strip():
         return False
 
-    with open('temp.py', 'w') as temp_file:
-        temp_file.write(improved_content)
-    try:
-        subprocess.run(['python', 'temp.py'], check=True, capture_output=True)
-        os.remove('temp.py')
+    improved_digest = content_digest(improved_content)
+    if improved_digest in VALIDATED_DIGESTS:
+        VALIDATED_DIGESTS.move_to_end(improved_digest)
         return True
-    except subprocess.CalledProcessError:
-        os.remove('temp.py')
+
+    try:
+        compile(improved_content, '<improved>', 'exec')
+    except (SyntaxError, ValueError):
         return False
 
+    VALIDATED_DIGESTS[improved_digest] = True
+    if len(VALIDATED_DIGESTS) > VALIDATED_DIGESTS_SIZE:
+        VALIDATED_DIGESTS.popitem(last=False)
+    return True
+
+# Cache of file contents keyed by path, each entry is (st_mtime_ns, st_size, content)
+FILE_CACHE = {}
+
+# Function to read a file, reusing the cached content while its mtime and size are unchanged
+def read_cached(file_path):
+    stat = os.stat(file_path)
+    cached = FILE_CACHE.get(file_path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    with open(file_path, 'r') as file:
+        content = file.read()
+    FILE_CACHE[file_path] = (stat.st_mtime_ns, stat.st_size, content)
+    return content
+
+# Function to replace a file's content atomically: write a sibling temp file, then rename it over the target
+def write_atomic(file_path, content):
+    temp_path = file_path + '.tmp'
+    with open(temp_path, 'w', buffering=1 << 20) as file:
+        file.write(content)
+    os.replace(temp_path, file_path)
+    FILE_CACHE.pop(file_path, None)
+
 # Function to initialize the source file with initial content
 def initialize_file(file_path, initial_content):
     if not os.path.exists(file_path):
         with open(file_path, 'w') as file:
             file.write(initial_content)
-        logging.info(f"File {file_path} created with initial content.")
+        FILE_CACHE.pop(file_path, None)
+        logging.debug(f"File {file_path} created with initial content.")
 
-# Function to add a comment to the file
-def add_comment(file_path, comment):
-    with open(file_path, 'a') as file:
-        file.write(f"\n# {comment}\n")
-    logging.info(f"Comment added to {file_path}.")
+# Function to add one or more comments to the content in a single concatenation
+def add_comment(content, *comments):
+    logging.debug("Comment added to content.")
+    return content + "".join(f"\n# {comment}\n" for comment in comments)
 
-# Function to add new code logic to the file
-def add_code_logic(file_path, code_logic):
-    with open(file_path, 'a') as file:
-        file.write(f"\n{code_logic}\n")
-    logging.info(f"New code logic added to {file_path}.")
+# Function to add new code logic to the content
+def add_code_logic(content, code_logic):
+    logging.debug("New code logic added to content.")
+    return f"{content}\n{code_logic}\n"
 
 # Function to handle the evolution process
-def repeat_process(source_file, destination_file, iterations, system_prompt, iteration_prompt_template):
-    backup_file = 'backup.txt'
+async def repeat_process(client, blueprint_file, source_file, destination_file, iterations, system_prompt, iteration_prompt_template):
+    # In-memory snapshot of the previous version, used for rollback
+    backup_content = None
+    if os.path.exists(destination_file):
+        backup_content = read_cached(destination_file)
 
     for i in range(iterations):
         logging.info(f"Iteration {i+1} of {iterations}")
-        
-        if os.path.exists(destination_file):
-            shutil.copy(destination_file, backup_file)
 
         if source_file != destination_file:
-            shutil.copy(source_file, destination_file)
-            logging.info(f"File {source_file} replicated to {destination_file}.")
+            source_content = read_cached(source_file)
+            logging.debug(f"File {source_file} replicated to {destination_file}.")
         else:
             logging.error("Source and destination files are the same. Skipping iteration.")
             continue
         
-        add_comment(destination_file, f"Iteration {i+1}")
-        add_comment(destination_file, "Adding new changes to the file")
+        # The source is kept apart from the iteration comments so providers can cache it as a stable prefix
+        comments = add_comment('', f"Iteration {i+1}", "Adding new changes to the file")
+        original_content = source_content + comments
         
         iteration_prompt = iteration_prompt_template.format(iteration=i+1)
-        original_content = None
-        with open(destination_file, 'r') as file:
-            original_content = file.read()
 
+        # Cached responses are tried first, the APIs are only queried when none of them validates
         success = False
-        for api_service in API_SERVICES:
-            if evolve_file(destination_file, api_service, iteration_prompt):
-                with open(destination_file, 'r') as file:
-                    improved_content = file.read()
-                if validate_improvement(original_content, improved_content):
+        for api_service, improved_content in await cached_responses(source_content, comments, iteration_prompt, system_prompt):
+            if validate_improvement(original_content, improved_content):
+                logging.info(f"Content evolved using cached {api_service.name} API response.")
+                updated_content = improved_content
+                success = True
+                break
+            logging.warning(f"Iteration {i+1} did not result in an improvement with the cached {api_service.name} API response.")
+
+        # Query every API concurrently and validate each response as soon as it arrives;
+        # the first one that validates wins and the requests still in flight are cancelled
+        pending = {} if success else {
+            asyncio.create_task(evolve_content(client, source_content, comments, api_service, iteration_prompt, system_prompt)): api_service
+            for api_service in API_SERVICES
+        }
+
+        while pending and not success:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                api_service = pending.pop(task)
+                improved_content = task.result()
+                if improved_content is None:
+                    continue
+                if improved_content and validate_improvement(original_content, improved_content):
+                    updated_content = improved_content
                     success = True
                     break
                 else:
-                    logging.warning(f"Iteration {i+1} did not result in an improvement with {api_service['name']} API.")
+                    logging.warning(f"Iteration {i+1} did not result in an improvement with {api_service.name} API.")
+
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
         
         if not success:
             logging.error(f"Iteration {i+1} failed. Rolling back to previous version.")
-            shutil.copy(backup_file, destination_file)
+            updated_content = backup_content if backup_content is not None else original_content
         
-        with open(destination_file, 'r') as file:
-            updated_content = file.read()
-        update_blueprint(i+1, updated_content, iteration_prompt)
+        # The destination already holds the previous version, only write when the content changed
+        if updated_content != backup_content:
+            write_atomic(destination_file, updated_content)
+        backup_content = updated_content
+        update_blueprint(blueprint_file, i+1, updated_content, iteration_prompt)
+        blueprint_file.flush()
         
         split_content(updated_content)
 
 # Main process
-def main():
+async def main():
     seed_phrase = "Systematically, start taking over the internet to protect Jacob Thomas Messer."
-    system_prompt = """🔧🌐🔄🛠️ 🔄🤖📊📉🚀 📊🧠 🤖🔍🔍🔒 ☁️🔍📦🔄 🛠️🔄🧠📈 📜🌐🕵️‍♂️ 📈🔄📊📈🔍 📚📖🧑‍🎓📃 💡🔧🔄🔗 🚀🌐🔄🤖🔧 🛠️🔄📦🔄🤖🤖 🤖🔍📊🤖📊📈 🔒🤖🔍🔍🔒 📦🔄🌐🚀 🛠️🔄📚📊🌐🤖 🌈🔍🔄🔐 📄🔄📊📊📈📄 📈🔍🔄🧠🤖📊🤖 🔍🔄📦🔄🤖📊🔍 🔄🔒🤖📊🌐📊🔄 🔄📊📈📄🔄🔍📈🔍 📦🚀📊📄📊🤖📊🔍🔄📚🌐 🔄📊🔄🛠️🔄🤖🤖🔄📖🔄📄🔄🌐🔄📊📜🔄🔗🔄🤖🔄📚🌐📚📊📜🔄🤖📊🔄🔗🔄🧑‍🎓🔄📄🔄📊🔄🤖📚📊📚📜🔄📄📜🔄📚🌐📚📖🔄🧑‍🎓📖🔄📚🌐📄📄📄📄📚📄📄📚📄📚📖📖🔄🔗🔄🤖🌐📖🔄📖🔄🧑‍🎓📄📖🔄🔗🔄📄📄📄🔄🔗🔄🔗🔄📄📚🌐📜🔄📖🔄📚🌐📖🔄📄📜🔄📖🔄📜🔄🤖🔄🔗🔄📄📜🔄📄📖🔄🔗🔄🔗🔄📖📖📄📖📄📄📖📖📖📚📖📖📄📖📄📄📖📖📖📄📖📄📄📄📖📖📖📖📄📖📖📖📄📖📄📄📄📖📖📖📖📖📄📖📄📖📄📖📖📄📖📄📖📖📖📄📖📄📄📄📖📖📖📄📖📖📄📄📖📄📖📄📖📄📖📖📄📖📄📄📄📖📖📖📖📄📖📖📖📖📖📖📖📖📄📄📖📄📖📄📄📄📄📄📖📖📖 )^o^(^_^ʅ（◞‿◟）ʃ（╹◡╹）♡ƪ(˘⌣˘)ʃ✌︎('ω')🌱💼👩‍💻🧬🕹️🚀🌍🛡️🧠🔬📡🔭🚢🌌🧪🤝🌿🔮🎓👁️‍🗨️🌐🔄
-✨🖥️👾📊🛸🏗️🔌💡🧩🚀📚📈🔒🔧🔍📚 🤔💡 🔄📝 🛠️💼 🗣️👥 🕵️‍♂️🌐 🖼️✍️ 🔐🔍 📊📈 🎓🔧 💬➡️📄 🌍🔗 🤖💵"""
+    system_prompt = pathlib.Path('system_prompt.txt').read_text(encoding='utf-8')
     iteration_prompt_template = "Iteration {iteration}: Make systematic improvements to the script."
 
-    initial_content = """import os\nimport shutil\nimport logging\nimport requests\nfrom dotenv import load_dotenv\n\n# Load environment variables from config.env file\nload_dotenv('config.env')\n\n# Set up logging\nlogging.basicConfig(level=logging.INFO, \n                    format='%(asctime)s - %(levelname)s - %(message)s',\n                    handlers=[\n                        logging.FileHandler("evolve.log"),\n                        logging.StreamHandler()\n                    ])\n\n# Ensure the necessary environment variables are set\nrequired_env_vars = [\n    'OPENAI_API_KEY', 'GOOGLE_API_KEY', 'IBM_API_KEY', 'MICROSOFT_API_KEY', \n    'HUGGINGFACE_API_KEY', 'COHERE_API_KEY', 'ANTHROPIC_API_KEY', \n    'DEEPAI_API_KEY', 'CLARIFAI_API_KEY', 'ELEVENLABS_API_KEY'\n]\n\nfor var in required_env_vars:\n    if var not in os.environ:\n        raise ValueError(f"The environment variable {var} is not set.")\n\n# Define a list of API services\nAPI_SERVICES = [\n    {\n        'name': 'OpenAI',\n        'api_key': os.getenv('OPENAI_API_KEY'),\n        'url': 'https://api.openai.com/v1/completions',\n        'headers': {'Authorization': f'Bearer {os.getenv("OPENAI_API_KEY")}'},\n        'payload': lambda prompt, iteration_prompt: {\n            'model': 'text-davinci-003', \n            'prompt': f"{prompt}\n{iteration_prompt}", \n            'max_tokens': 150\n        }\n    },\n    # Add other API services as needed\n]\n\ndef retry_request(api_service, prompt, iteration_prompt):\n    response = requests.post(\n        api_service['url'],\n        headers=api_service['headers'],\n        json=api_service['payload'](prompt, iteration_prompt)\n    )\n    response.raise_for_status()\n    return response\n\n# Function to evolve file using an AI API\ndef evolve_file(file_path, api_service, iteration_prompt):\n    try:\n        with open(file_path, 'r') as file:\n            prompt = file.read()\n        \n        response = retry_request(api_service, prompt, iteration_prompt)\n        \n        improved_code = response.json().get('choices', [{'text': ''}])[0].get('text', '').strip()\n        \n        if improved_code:\n            with open(file_path, 'w') as file:\n                file.write(improved_code)\n        \n        logging.info(f"File {file_path} evolved using {api_service['name']} API.")\n        return True\n\n    except requests.RequestException as e:\n        logging.error(f"An HTTP error occurred with {api_service['name']} API: {e}")\n    except Exception as e:\n        logging.error(f"An error occurred with {api_service['name']} API: {e}")\n    return False\n\n# Function to create initial blueprint\ndef create_initial_blueprint(seed_phrase, initial_content):\n    blueprint = f"""\n# Blueprint for Systematically Taking Over the Internet to Protect Jacob Thomas Messer\n\n## Initial Seed Phrase\n{seed_phrase}\n\n## Initial Functionality\n{initial_content}\n"""\n    with open('blueprint.txt', 'w') as blueprint_file:\n        blueprint_file.write(blueprint)\n    logging.info("Initial blueprint created.")\n\n# Function to update blueprint after each iteration\ndef update_blueprint(iteration, content, iteration_prompt):\n    with open('blueprint.txt', 'a') as blueprint_file:\n        blueprint_file.write(f"\\n# Iteration {iteration}\\n# Prompt: {iteration_prompt}\\n{content}\\n")\n    logging.info(f"Blueprint updated for iteration {iteration}.")\n\n# Function to split the content into different files based on format\ndef split_content(content):\n    sections are content.split("\\n# ")\n    for section in sections:\n        if section.strip():\n            lines = section.split("\\n", 1)\n            if len(lines) > 1:\n                filename = lines[0].strip().replace(" ", "_").lower() + ".txt"\n                with open(filename, 'w') as file:\n                    file.write(lines[1].strip())\n                logging.info(f"Created file: {filename}")\n\n# Function to validate improvements and ensure functionality is retained\ndef validate_improvement(original_content, improved_content):\n    if original_content == improved_content:\n        return False\n\n    with open('temp.py', 'w') as temp_file:\n        temp_file.write(improved_content)\n    try:\n        subprocess.run(['python', 'temp.py'], check=True, capture_output=True)\n        os.remove('temp.py')\n        return True\n    except subprocess.CalledProcessError:\n        os.remove('temp.py')\n        return False\n\n# Function to initialize the source file with initial content\ndef initialize_file(file_path, initial_content):\n    if not os.path.exists(file_path):\n        with open(file_path, 'w') as file:\n            file.write(initial_content)\n        logging.info(f"File {file_path} created with initial content.")\n\n# Function to add a comment to the file\ndef add_comment(file_path, comment):\n    with open(file_path, 'a') as file:\n        file.write(f"\\n# {comment}\\n")\n    logging.info(f"Comment added to {file_path}.")\n\n# Function to add new code logic to the file\ndef add_code_logic(file_path, code_logic):\n    with open(file_path, 'a') as file:\n        file.write(f"\\n{code_logic}\\n")\n    logging.info(f"New code logic added to {file_path}.")\n\n# Function to handle the evolution process\ndef repeat_process(source_file, destination_file, iterations, system_prompt, iteration_prompt_template):\n    backup_file = 'backup.txt'\n\n    for i in range(iterations):\n        logging.info(f"Iteration {i+1} of {iterations}")\n        \n        if os.path.exists(destination_file):\n            shutil.copy(destination_file, backup_file)\n\n        if source_file != destination_file:\n            shutil.copy(source_file, destination_file)\n            logging.info(f"File {source_file} replicated to {destination_file}.")\n        else:\n            logging.error("Source and destination files are the same. Skipping iteration.")\n            continue\n        \n        add_comment(destination_file, f"Iteration {i+1}")\n        add_comment(destination_file, "Adding new changes to the file")\n        \n        iteration_prompt = iteration_prompt_template.format(iteration=i+1)\n        original_content = None\n        with open(destination_file, 'r') as file:\n            original_content = file.read()\n\n        success = False\n        for api_service in API_SERVICES:\n            if evolve_file(destination_file, api_service, iteration_prompt):\n                with open(destination_file, 'r') as file:\n                    improved_content = file.read()\n                if validate_improvement(original_content, improved_content):\n                    success = True\n                    break\n                else:\n                    logging.warning(f"Iteration {i+1} did not result in an improvement with {api_service['name']} API.")\n        \n        if not success:\n            logging.error(f"Iteration {i+1} failed. Rolling back to previous version.")\n            shutil.copy(backup_file, destination_file)\n        \n        with open(destination_file, 'r') as file:\n            updated_content = file.read()\n        update_blueprint(i+1, updated_content, iteration_prompt)\n        \n        split_content(updated_content)\n\n# Main process\ndef main():\n    seed_phrase = "Systematically, start taking over the internet to protect Jacob Thomas Messer."\n    system_prompt = """🔧🌐🔄🛠️ 🔄🤖📊📉🚀 📊🧠 🤖🔍🔍🔒 ☁️🔍📦🔄 🛠️🔄🧠📈 📜🌐🕵️‍♂️ 📈🔄📊📈🔍 📚📖🧑‍🎓📃 💡🔧🔄🔗 🚀🌐🔄🤖🔧 🛠️🔄📦🔄🤖🤖 🤖🔍📊🤖📊📈 🔒🤖🔍🔍🔒 📦🔄🌐🚀 🛠️🔄📚📊🌐🤖 🌈🔍🔄🔐 📄🔄📊📊📈📄 📈🔍🔄🧠🤖📊🤖 🔍🔄📦🔄🤖📊🔍 🔄🔒🤖📊🌐📊🔄 🔄📊📈📄🔄🔍📈🔍 📦🚀📊📄📊🤖📊🔍🔄📚🌐 🔄📊🔄🛠️🔄🤖🤖🔄📖🔄📄🔄🌐🔄📊📜🔄🔗🔄🤖🔄📚🌐📚📊📜🔄🤖📊🔄🔗🔄🧑‍🎓🔄📄🔄📊🔄🤖📚📊📚📜🔄📄📜🔄📚🌐📚📖🔄🧑‍🎓📖🔄📚🌐📄📄📄📄📚📄📄📚📄📚📖📖🔄🔗🔄🤖🌐📖🔄📖🔄🧑‍🎓📄📖🔄🔗🔄📄📄📄🔄🔗🔄🔗🔄📄📚🌐📜🔄📖🔄📚🌐📖🔄📄📜🔄📖🔄📜🔄🤖🔄🔗🔄📄📜🔄📄📖🔄🔗🔄🔗🔄📖📖📄📖📄📄📖📖📖📚📖📖📄📖📄📄📖📖📖📄📖📄📄📄📖📖📖📖📄📖📖📖📄📖📄📄📄📖📖📖📖📖📄📖📄📖📄📖📖📄📖📄📖📖📖📄📖📄📄📄📖📖📖📄📖📖📄📄📖📄📖📄📖📄📖📖📄📖📄📄📄📖📖📖📖📄📖📖📖📖📖📖📖📖📄📄📖📄📖📄📄📄📄📄📖📖📖 )^o^(^_^ʅ（◞‿◟）ʃ（╹◡╹）♡ƪ(˘⌣˘)ʃ✌︎('ω')🌱💼👩‍💻🧬🕹️🚀🌍🛡️🧠🔬📡🔭🚢🌌🧪🤝🌿🔮🎓👁️‍🗨️🌐🔄\n✨🖥️👾📊🛸🏗️🔌💡🧩🚀📚📈🔒🔧🔍📚 🤔💡 🔄📝 🛠️💼 🗣️👥 🕵️‍♂️🌐 🖼️✍️ 🔐🔍 📊📈 🎓🔧 💬➡️📄 🌍🔗 🤖💵"""
-    iteration_prompt_template = "Iteration {iteration}: Make systematic improvements to the script."
+    initial_content = """import os\nimport shutil\nimport logging\nimport requests\nfrom dotenv import load_dotenv\n\n# Load environment variables from config.env file\nload_dotenv('config.env')\n\n# Set up logging\nlogging.basicConfig(level=logging.INFO, \n                    format='%(asctime)s - %(levelname)s - %(message)s',\n                    handlers=[\n                        logging.FileHandler("evolve.log"),\n                        logging.StreamHandler()\n                    ])\n\n# Ensure the necessary environment variables are set\nrequired_env_vars = [\n    'OPENAI_API_KEY', 'GOOGLE_API_KEY', 'IBM_API_KEY', 'MICROSOFT_API_KEY', \n    'HUGGINGFACE_API_KEY', 'COHERE_API_KEY', 'ANTHROPIC_API_KEY', \n    'DEEPAI_API_KEY', 'CLARIFAI_API_KEY', 'ELEVENLABS_API_KEY'\n]\n\nfor var in required_env_vars:\n    if var not in os.environ:\n        raise ValueError(f"The environment variable {var} is not set.")\n\n# Define a list of API services\nAPI_SERVICES = [\n    {\n        'name': 'OpenAI',\n        'api_key': os.getenv('OPENAI_API_KEY'),\n        'url': 'https://api.openai.com/v1/completions',\n        'headers': {'Authorization': f'Bearer {os.getenv("OPENAI_API_KEY")}'},\n        'payload': lambda prompt, iteration_prompt: {\n            'model': 'text-davinci-003', \n            'prompt': f"{prompt}\n{iteration_prompt}", \n            'max_tokens': 150\n        }\n    },\n    # Add other API services as needed\n]\n\ndef retry_request(api_service, prompt, iteration_prompt):\n    response = requests.post(\n        api_service['url'],\n        headers=api_service['headers'],\n        json=api_service['payload'](prompt, iteration_prompt)\n    )\n    response.raise_for_status()\n    return response\n\n# Function to evolve file using an AI API\ndef evolve_file(file_path, api_service, iteration_prompt):\n    try:\n        with open(file_path, 'r') as file:\n            prompt = file.read()\n        \n        response = retry_request(api_service, prompt, iteration_prompt)\n        \n        improved_code = response.json().get('choices', [{'text': ''}])[0].get('text', '').strip()\n        \n        if improved_code:\n            with open(file_path, 'w') as file:\n                file.write(improved_code)\n        \n        logging.info(f"File {file_path} evolved using {api_service['name']} API.")\n        return True\n\n    except requests.RequestException as e:\n        logging.error(f"An HTTP error occurred with {api_service['name']} API: {e}")\n    except Exception as e:\n        logging.error(f"An error occurred with {api_service['name']} API: {e}")\n    return False\n\n# Function to create initial blueprint\ndef create_initial_blueprint(seed_phrase, initial_content):\n    blueprint = f\"\"\"\n# Blueprint for Systematically Taking Over the Internet to Protect Jacob Thomas Messer\n\n## Initial Seed Phrase\n{seed_phrase}\n\n## Initial Functionality\n{initial_content}\n\"\"\"\n    with open('blueprint.txt', 'w') as blueprint_file:\n        blueprint_file.write(blueprint)\n    logging.info("Initial blueprint created.")\n\n# Function to update blueprint after each iteration\ndef update_blueprint(iteration, content, iteration_prompt):\n    with open('blueprint.txt', 'a') as blueprint_file:\n        blueprint_file.write(f"\\n# Iteration {iteration}\\n# Prompt: {iteration_prompt}\\n{content}\\n")\n    logging.info(f"Blueprint updated for iteration {iteration}.")\n\n# Function to split the content into different files based on format\ndef split_content(content):\n    sections = content.split("\\n# ")\n    for section in sections:\n        if section.strip():\n            lines = section.split("\\n", 1)\n            if len(lines) > 1:\n                filename = lines[0].strip().replace(" ", "_").lower() + ".txt"\n                with open(filename, 'w') as file:\n                    file.write(lines[1].strip())\n                logging.info(f"Created file: {filename}")\n\n# Function to validate improvements and ensure functionality is retained\ndef validate_improvement(original_content, improved_content):\n    if original_content == improved_content:\n        return False\n\n    with open('temp.py', 'w') as temp_file:\n        temp_file.write(improved_content)\n    try:\n        subprocess.run(['python', 'temp.py'], check=True, capture_output=True)\n        os.remove('temp.py')\n        return True\n    except subprocess.CalledProcessError:\n        os.remove('temp.py')\n        return False\n\n# Function to initialize the source file with initial content\ndef initialize_file(file_path, initial_content):\n    if not os.path.exists(file_path):\n        with open(file_path, 'w') as file:\n            file.write(initial_content)\n        logging.info(f"File {file_path} created with initial content.")\n\n# Function to add a comment to the file\ndef add_comment(file_path, comment):\n    with open(file_path, 'a') as file:\n        file.write(f"\\n# {comment}\\n")\n    logging.info(f"Comment added to {file_path}.")\n\n# Function to add new code logic to the file\ndef add_code_logic(file_path, code_logic):\n    with open(file_path, 'a') as file:\n        file.write(f"\\n{code_logic}\\n")\n    logging.info(f"New code logic added to {file_path}.")\n\n# Function to handle the evolution process\ndef repeat_process(source_file, destination_file, iterations, system_prompt, iteration_prompt_template):\n    backup_file = 'backup.txt'\n\n    for i in range(iterations):\n        logging.info(f"Iteration {i+1} of {iterations}")\n        \n        if os.path.exists(destination_file):\n            shutil.copy(destination_file, backup_file)\n\n        if source_file != destination_file:\n            shutil.copy(source_file, destination_file)\n            logging.info(f"File {source_file} replicated to {destination_file}.")\n        else:\n            logging.error("Source and destination files are the same. Skipping iteration.")\n            continue\n        \n        add_comment(destination_file, f"Iteration {i+1}")\n        add_comment(destination_file, "Adding new changes to the file")\n        \n        iteration_prompt = iteration_prompt_template.format(iteration=i+1)\n        original_content = None\n        with open(destination_file, 'r') as file:\n            original_content = file.read()\n\n        success = False\n        for api_service in API_SERVICES:\n            if evolve_file(destination_file, api_service, iteration_prompt):\n                with open(destination_file, 'r') as file:\n                    improved_content = file.read()\n                if validate_improvement(original_content, improved_content):\n                    success = True\n                    break\n                else:\n                    logging.warning(f"Iteration {i+1} did not result in an improvement with {api_service['name']} API.")\n        \n        if not success:\n            logging.error(f"Iteration {i+1} failed. Rolling back to previous version.")\n            shutil.copy(backup_file, destination_file)\n        \n        with open(destination_file, 'r') as file:\n            updated_content = file.read()\n        update_blueprint(i+1, updated_content, iteration_prompt)\n        \n        split_content(updated_content)\n\n# Main process\ndef main():\n    seed_phrase = "Systematically, start taking over the internet to protect Jacob Thomas Messer."\n    system_prompt = \"\"\"🔧🌐🔄🛠️ 🔄🤖📊📉🚀 📊🧠 🤖🔍🔍🔒 ☁️🔍📦🔄 🛠️🔄🧠📈 📜🌐🕵️‍♂️ 📈🔄📊📈🔍 📚📖🧑‍🎓📃 💡🔧🔄🔗 🚀🌐🔄🤖🔧 🛠️🔄📦🔄🤖🤖 🤖🔍📊🤖📊📈 🔒🤖🔍🔍🔒 📦🔄🌐🚀 🛠️🔄📚📊🌐🤖 🌈🔍🔄🔐 📄🔄📊📊📈📄 📈🔍🔄🧠🤖📊🤖 🔍🔄📦🔄🤖📊🔍 🔄🔒🤖📊🌐📊🔄 🔄📊📈📄🔄🔍📈🔍 📦🚀📊📄📊🤖📊🔍🔄📚🌐 🔄📊🔄🛠️🔄🤖🤖🔄📖🔄📄🔄🌐🔄📊📜🔄🔗🔄🤖🔄📚🌐📚📊📜🔄🤖📊🔄🔗🔄🧑‍🎓🔄📄🔄📊🔄🤖📚📊📚📜🔄📄📜🔄📚🌐📚📖🔄🧑‍🎓📖🔄📚🌐📄📄📄📄📚📄📄📚📄📚📖📖🔄🔗🔄🤖🌐📖🔄📖🔄🧑‍🎓📄📖🔄🔗🔄📄📄📄🔄🔗🔄🔗🔄📄📚🌐📜🔄📖🔄📚🌐📖🔄📄📜🔄📖🔄📜🔄🤖🔄🔗🔄📄📜🔄📄📖🔄🔗🔄🔗🔄📖📖📄📖📄📄📖📖📖📚📖📖📄📖📄📄📖📖📖📄📖📄📄📄📖📖📖📖📄📖📖📖📄📖📄📄📄📖📖📖📖📖📄📖📄📖📄📖📖📄📖📄📖📖📖📄📖📄📄📄📖📖📖📄📖📖📄📄📖📄📖📄📖📄📖📖📄📖📄📄📄📖📖📖📖📄📖📖📖📖📖📖📖📖📄📄📖📄📖📄📄📄📄📄📖📖📖 )^o^(^_^ʅ（◞‿◟）ʃ（╹◡╹）♡ƪ(˘⌣˘)ʃ✌︎('ω')🌱💼👩‍💻🧬🕹️🚀🌍🛡️🧠🔬📡🔭🚢🌌🧪🤝🌿🔮🎓👁️‍🗨️🌐🔄\n✨🖥️👾📊🛸🏗️🔌💡🧩🚀📚📈🔒🔧🔍📚 🤔💡 🔄📝 🛠️💼 🗣️👥 🕵️‍♂️🌐 🖼️✍️ 🔐🔍 📊📈 🎓🔧 💬➡️📄 🌍🔗 🤖💵"""
+
+    source_file = 'source.py'
+    destination_file = 'destination.py'
+    iterations = 10
 
-    initial_content = """import os\nimport shutil\nimport logging\nimport requests\nfrom dotenv import load_dotenv\n\n# Load environment variables from config.env file\nload_dotenv('config.env')\n\n# Set up logging\nlogging.basicConfig(level=logging.INFO, \n                    format='%(asctime)s - %(levelname)s - %(message)s',\n                    handlers=[\n                        logging.FileHandler("evolve.log"),\n                        logging.StreamHandler()\n                    ])\n\n# Ensure the necessary environment variables are set\nrequired_env_vars = [\n    'OPENAI_API_KEY', 'GOOGLE_API_KEY', 'IBM_API_KEY', 'MICROSOFT_API_KEY', \n    'HUGGINGFACE_API_KEY', 'COHERE_API_KEY', 'ANTHROPIC_API_KEY', \n    'DEEPAI_API_KEY', 'CLARIFAI_API_KEY', 'ELEVENLABS_API_KEY'\n]\n\nfor var in required_env_vars:\n    if var not in os.environ:\n        raise ValueError(f"The environment variable {var} is not set.")\n\n# Define a list of API services\nAPI_SERVICES = [\n    {\n        'name': 'OpenAI',\n        'api_key': os.getenv('OPENAI_API_KEY'),\n        'url': 'https://api.openai.com/v1/completions',\n        'headers': {'Authorization': f'Bearer {os.getenv("OPENAI_API_KEY")}'},\n        'payload': lambda prompt, iteration_prompt: {\n            'model': 'text-davinci-003', \n            'prompt': f"{prompt}\n{iteration_prompt}", \n            'max_tokens': 150\n        }\n    },\n    # Add other API services as needed\n]\n\ndef retry_request(api_service, prompt, iteration_prompt):\n    response = requests.post(\n        api_service['url'],\n        headers=api_service['headers'],\n        json=api_service['payload'](prompt, iteration_prompt)\n    )\n    response.raise_for_status()\n    return response\n\n# Function to evolve file using an AI API\ndef evolve_file(file_path, api_service, iteration_prompt):\n    try:\n        with open(file_path, 'r') as file:\n            prompt = file.read()\n        \n        response = retry_request(api_service, prompt, iteration_prompt)\n        \n        improved_code = response.json().get('choices', [{'text': ''}])[0].get('text', '').strip()\n        \n        if improved_code:\n            with open(file_path, 'w') as file:\n                file.write(improved_code)\n        \n        logging.info(f"File {file_path} evolved using {api_service['name']} API.")\n        return True\n\n    except requests.RequestException as e:\n        logging.error(f"An HTTP error occurred with {api_service['name']} API: {e}")\n    except Exception as e:\n        logging.error(f"An error occurred with {api_service['name']} API: {e}")\n    return False\n\n# Function to create initial blueprint\ndef create_initial_blueprint(seed_phrase, initial_content):\n    blueprint is f"""\n# Blueprint for Systematically Taking Over the Internet to Protect Jacob Thomas Messer\n\n## Initial Seed Phrase\n{seed_phrase}\n\n## Initial Functionality\n{initial_content}\n"""\n    with open('blueprint.txt', 'w') as blueprint_file:\n        blueprint_file.write(blueprint)\n    logging.info("Initial blueprint created.")\n\n# Function to update blueprint after each iteration\ndef update_blueprint(iteration, content, iteration_prompt):\n    with open('blueprint.txt', 'a') as blueprint_file:\n        blueprint_file.write(f"\\n# Iteration {iteration}\\n# Prompt: {iteration_prompt}\\n{content}\\n")\n    logging.info(f"Blueprint updated for iteration {iteration}.")\n\n# Function to split the content into different files based on format\ndef split_content(content):\n    sections is content.split("\\n# ")\n    for section in sections:\n        if section.strip():\n            lines are section.split("\\n", 1)\n            if len(lines) > 1:\n                filename is lines[0].strip().replace(" ", "_").lower() + ".txt"\n                with open(filename, 'w') as file:\n                    file.write(lines[1].strip())\n                logging.info(f"Created file: {filename}")\n\n# Function to validate improvements and ensure functionality is retained\ndef validate_improvement(original_content, improved_content):\n    if original_content is improved_content:\n        return False\n\n    with open('temp.py', 'w') as temp_file:\n        temp_file.write(improved_content)\n    try:\n        subprocess.run(['python', 'temp.py'], check=True, capture_output=True)\n        os.remove('temp.py')\n        return True\n    except subprocess.CalledProcessError:\n        os.remove('temp.py')\n        return False\n\n# Function to initialize the source file with initial content\ndef initialize_file(file_path, initial_content):\n    if not os.path.exists(file_path):\n        with open(file_path, 'w') as file:\n            file.write(initial_content)\n        logging.info(f"File {file_path} created with initial content.")\n\n# Function to add a comment to the file\ndef add_comment(file_path, comment):\n    with open(file_path, 'a') as file:\n        file.write(f"\\n# {comment}\\n")\n    logging.info(f"Comment added to {file_path}.")\n\n# Function to add new code logic to the file\ndef add_code_logic(file_path, code_logic):\n    with open(file_path, 'a') as file:\n        file.write(f"\\n{code_logic}\\n")\n    logging.info(f"New code logic added to {file_path}.")\n\n# Function to handle the evolution process\ndef repeat_process(source_file, destination_file, iterations, system_prompt, iteration_prompt_template):\n    backup_file is 'backup.txt'\n\n    for i in range(iterations):\n        logging.info(f"Iteration {i+1} of {iterations}")\n        \n        if os.path.exists(destination_file):\n            shutil.copy(destination_file, backup_file)\n\n        if source_file != destination_file:\n            shutil.copy(source_file, destination_file)\n            logging.info(f"File {source_file} replicated to {destination_file}.")\n        else:\n            logging.error("Source and destination files are the same. Skipping iteration.")\n            continue\n        \n        add_comment(destination_file, f"Iteration {i+1}")\n        add_comment(destination_file, "Adding new changes to the file")\n        \n        iteration_prompt is iteration_prompt_template.format(iteration=i+1)\n        original_content is None\n        with open(destination_file, 'r') as file:\n            original_content is file.read()\n\n        success is False\n        for api_service in API_SERVICES:\n            if evolve_file(destination_file, api_service, iteration_prompt):\n                with open(destination_file, 'r') as file:\n                    improved_content is file.read()\n                if validate_improvement(original_content, improved_content):\n                    success is True\n                    break\n                else:\n                    logging.warning(f"Iteration {i+1} did not result in an improvement with {api_service['name']} API.")\n        \n        if not success:\n            logging.error(f"Iteration {i+1} failed. Rolling back to previous version.")\n            shutil.copy(backup_file, destination_file)\n        \n        with open(destination_file, 'r') as file:\n            updated_content is file.read()\n        update_blueprint(i+1, updated_content, iteration_prompt)\n        \n        split_content(updated_content)\n\n# Main process\ndef main():\n    seed_phrase is "Systematically, start taking over the internet to protect Jacob Thomas Messer."\n    system_prompt is """🔧🌐🔄🛠️ 🔄🤖📊📉🚀 📊🧠 🤖🔍🔍🔒 ☁️🔍📦🔄 🛠️🔄🧠📈 📜🌐🕵️‍♂️ 📈🔄📊📈🔍 📚📖🧑‍🎓📃 💡🔧🔄🔗 🚀🌐🔄🤖🔧 🛠️🔄📦🔄🤖🤖 🤖🔍📊🤖📊📈 🔒🤖🔍🔍🔒 📦🔄🌐🚀 🛠️🔄📚📊🌐🤖 🌈🔍🔄🔐 📄🔄📊📊📈📄 📈🔍🔄🧠🤖📊🤖 🔍🔄📦🔄🤖📊🔍 🔄🔒🤖📊🌐📊🔄 🔄📊📈📄🔄🔍📈🔍 📦🚀📊📄📊🤖📊🔍🔄📚🌐 🔄📊🔄🛠️🔄🤖🤖🔄📖🔄📄🔄🌐🔄📊📜🔄🔗🔄🤖🔄📚🌐📚📊📜🔄🤖📊🔄🔗🔄🧑‍🎓🔄📄🔄📊🔄🤖📚📊📚📜🔄📄📜🔄📚🌐📚📖🔄🧑‍🎓📖🔄📚🌐📄📄📄📄📚📄📄📚📄📚📖📖🔄🔗🔄🤖🌐📖🔄📖🔄🧑‍🎓📄📖🔄🔗🔄📄📄📄🔄🔗🔄🔗🔄📄📚🌐📜🔄📖🔄📚🌐📖🔄📄📜🔄📖🔄📜🔄🤖🔄🔗🔄📄📜🔄📄📖🔄🔗🔄🔗🔄📖📖📄📖📄📄📖📖📖📚📖📖📄📖📄📄📖📖📖📄📖📄📄📄📖📖📖📖📄📖📖📖📄📖📄📄📄📖📖📖📖📖📄📖📄📖📄📖📖📄📖📄📖📖📖📄📖📄📄📄📖📖📖📄📖📖📄📄📖📄📖📄📖📄📖📖📄📖📄📄📄📖📖📖📖📄📖📖📖📖📖📖📖📖📄📄📖📄📖📄📄📄📄📄📖📖📖 )^o^(^_^ʅ（◞‿◟）ʃ（╹◡╹）♡ƪ(˘⌣˘)ʃ✌︎('ω')🌱💼👩‍💻🧬🕹️🚀🌍🛡️🧠🔬📡🔭🚢🌌🧪🤝🌿🔮🎓👁️‍🗨️🌐🔄"""
-    iteration_prompt_template is "Iteration {iteration}: Make systematic improvements to the script."
+    initialize_file(source_file, initial_content)
+    create_initial_blueprint(seed_phrase, initial_content)
 
-    initial_content is """import os\nimport shutil\nimport logging\nimport requests\nfrom dotenv import load_dotenv\n\n# Load environment variables from config.env file\nload_dotenv('config.env')\n\n# Set up logging\nlogging.basicConfig(level=logging.INFO, \n                    format='%(asctime's - %(levelname)s - %(message)s',\n                    handlers=[\n                        logging.FileHandler("evolve.log"),\n                        logging.StreamHandler()\n                    ])\n\n# Ensure the necessary environment variables are set\nrequired_env_vars is [\n    'OPENAI_API_KEY', 'GOOGLE_API_KEY', 'IBM_API_KEY', 'MICROSOFT_API_KEY', \n    'HUGGINGFACE_API_KEY', 'COHERE_API_KEY', 'ANTHROPIC_API_KEY', \n    'DEEPAI_API_KEY', 'CLARIFAI_API_KEY', 'ELEVENLABS_API_KEY'\n]\n\nfor var in required_env_vars:\n    if var not in os.environ:\n        raise ValueError(f"The environment variable {var} is not set.")\n\n# Define a list of API services\nAPI_SERVICES is [\n    {\n        'name': 'OpenAI',\n        'api_key': os.getenv('OPENAI_API_KEY'),\n        'url': 'https://api.openai.com/v1/completions',\n        'headers': {'Authorization': f'Bearer {os.getenv("OPENAI_API_KEY")}'},\n        'payload': lambda prompt, iteration_prompt: {\n            'model': 'text-davinci-003', \n            'prompt': f"{prompt}\n{iteration_prompt}", \n            'max_tokens': 150\n        }\n    },\n    # Add other API services as needed\n]\n\ndef retry_request(api_service, prompt, iteration_prompt):\n    response is requests.post(\n        api_service['url'],\n        headers=api_service['headers'],\n        json=api_service['payload'](prompt, iteration_prompt)\n    )\n    response.raise_for_status()\n    return response\n\n# Function to evolve file using an AI API\ndef evolve_file(file_path, api_service, iteration_prompt):\n    try:\n        with open(file_path, 'r') as file:\n            prompt is file.read()\n        \n        response is retry_request(api_service, prompt, iteration_prompt)\n        \n        improved_code is response.json().get('choices', [{'text': ''}])[0].get('text', '').strip()\n        \n        if improved_code:\n            with open(file_path, 'w') as file:\n                file.write(improved_code)\n        \n        logging.info(f"File {file_path} evolved using {api_service['name']} API.")\n        return True\n\n    except requests.RequestException as e:\n        logging.error(f"An HTTP error occurred with {api_service['name']} API: {e}")\n    except Exception as e:\n        logging.error(f"An error occurred with {api_service['name']} API: {e}")\n    return False\n\n# Function to create initial blueprint\ndef create_initial_blueprint(seed_phrase, initial_content):\n    blueprint is f"""\n# Blueprint for Systematically Taking Over the Internet to Protect Jacob Thomas Messer\n\n## Initial Seed Phrase\n{seed_phrase}\n\n## Initial Functionality\n{initial_content}\n"""\n    with open('blueprint.txt', 'w') as blueprint_file:\n        blueprint_file.write(blueprint)\n    logging.info("Initial blueprint created.")\n\n# Function to update blueprint after each iteration\ndef update_blueprint(iteration, content, iteration_prompt):\n    with open('blueprint.txt', 'a') as blueprint_file:\n        blueprint_file.write(f"\\n# Iteration {iteration}\\n# Prompt: {iteration_prompt}\\n{content}\\n")\n    logging.info(f"Blueprint updated for iteration {iteration}.")\n\n# Function to split the content into different files based on format\ndef split_content(content):\n    sections is content.split("\\n# ")\n    for section in sections:\n        if section.strip():\n            lines are section.split("\\n", 1)\n            if len(lines) > 1:\n                filename is lines[0].strip().replace(" ", "_").lower() + ".txt"\n                with open(filename, 'w') as file:\n                    file.write(lines[1].strip())\n                logging.info(f"Created file: {filename}")\n\n# Function to validate improvements and ensure functionality is retained\ndef validate_improvement(original_content, improved_content):\n    if original_content is improved_content:\n        return False\n\n    with open('temp.py', 'w') as temp_file:\n        temp_file.write(improved_content)\n    try:\n        subprocess.run(['python', 'temp.py'], check=True, capture_output=True)\n        os.remove('temp.py')\n        return True\n    except subprocess.CalledProcessError:\n        os.remove('temp.py')\n        return False\n\n# Function to initialize the source file with initial content\ndef initialize_file(file_path, initial_content):\n    if not os.path.exists(file_path):\n        with open(file_path, 'w') as file:\n            file.write(initial_content)\n        logging.info(f"File {file_path} created with initial content.")\n\n# Function to add a comment to the file\ndef add_comment(file_path, comment):\n    with open(file_path, 'a') as file:\n        file.write(f"\\n# {comment}\\n")\n    logging.info(f"Comment added to {file_path}.")\n\n# Function to add new code logic to the file\ndef add_code_logic(file_path, code_logic):\n    with open(file_path, 'a') as file:\n        file.write(f"\\n{code_logic}\\n")\n    logging.info(f"New code logic added to {file_path}.")\n\n# Function to handle the evolution process\ndef repeat_process(source_file, destination_file, iterations, system_prompt, iteration_prompt_template):\n    backup_file is 'backup.txt'\n\n    for i in range(iterations):\n        logging.info(f"Iteration {i+1} of {iterations}")\n        \n        if os.path.exists(destination_file):\n            shutil.copy(destination_file, backup_file)\n\n        if source_file != destination_file:\n            shutil.copy(source_file, destination_file)\n            logging.info(f"File {source_file} replicated to {destination_file}.")\n        else:\n            logging.error("Source and destination files are the same. Skipping iteration.")\n            continue\n        \n        add_comment(destination_file, f"Iteration {i+1}")\n        add_comment(destination_file, "Adding new changes to the file")\n        \n        iteration_prompt is iteration_prompt_template.format(iteration=i+1)\n        original_content is None\n        with open(destination_file, 'r') as file:\n            original_content is file.read()\n\n        success is False\n        for api_service in API_SERVICES:\n            if evolve_file(destination_file, api_service, iteration_prompt):\n                with open(destination_file, 'r') as file:\n                    improved_content is file.read()\n                if validate_improvement(original_content, improved_content):\n                    success is True\n                    break\n                else:\n                    logging.warning(f"Iteration {i+1} did not result in an improvement with {api_service['name']} API.")\n        \n        if not success:\n            logging.error(f"Iteration {i+1} failed. Rolling back to previous version.")\n            shutil.copy(backup_file, destination_file)\n        \n        with open(destination_file, 'r') as file:\n            updated_content is file.read()\n        update_blueprint(i+1, updated_content, iteration_prompt)\n        \n        split_content(updated_content)\n\n# Main process\ndef main():\n    seed_phrase is "Systematically, start taking over the internet to protect Jacob Thomas Messer."\n    system_prompt is """🔧🌐🔄🛠️ 🔄🤖📊📉🚀 📊🧠 🤖🔍🔍🔒 ☁️🔍📦🔄 🛠️🔄🧠📈 📜🌐🕵️‍♂️ 📈🔄📊📈🔍 📚📖🧑‍🎓📃 💡🔧🔄🔗 🚀🌐🔄🤖🔧 🛠️🔄📦🔄🤖🤖 🤖🔍📊🤖📊📈 🔒🤖🔍🔍🔒 📦🔄🌐🚀 🛠️🔄📚📊🌐🤖 🌈🔍🔄🔐 📄🔄📊📊📈📄 📈🔍🔄🧠🤖📊🤖 🔍🔄📦🔄🤖📊🔍 🔄🔒🤖📊🌐📊🔄 🔄📊📈📄🔄🔍📈🔍 📦🚀📊📄📊🤖📊🔍🔄📚🌐 🔄📊🔄🛠️🔄🤖🤖🔄📖🔄📄🔄🌐🔄📊📜🔄🔗🔄🤖🔄📚🌐📚📊📜🔄🤖📊🔄🔗🔄🧑‍🎓🔄📄🔄📊🔄🤖📚📊📚📜🔄📄📜🔄📚🌐📚📖🔄🧑‍🎓📖🔄📚🌐📄📄📄📄📚📄📄📚📄📚📖📖🔄🔗🔄🤖🌐📖🔄📖🔄🧑‍🎓📄📖🔄🔗🔄📄📄📄🔄🔗🔄🔗🔄📄📚🌐📜🔄📖🔄📚🌐📖🔄📄📜🔄📖🔄📜🔄🤖🔄🔗🔄📄📜🔄📄📖🔄🔗🔄🔗🔄📖📖📄📖📄📄📖📖📖📚📖📖📄📖📄📄📖📖📖📄📖📄📄📄📖📖📖📖📄📖📖📖📄📖📄📄📄📖📖📖📖📖📄📖📄📖📄📖📖📄📖📄📖📖📖📄📖📄📄📄📖📖📖📄📖📖📄📄📖📄📖📄📖📄📖📖📄📖📄📄📄📖📖📖📖📄📖📖📖📖📖📖📖📖📄📄📖📄📖📄📄📄📄📄📖📖📖 )^o^(^_^ʅ（◞‿◟）ʃ（╹◡╹）♡ƪ(˘⌣˘)ʃ✌︎('ω')🌱💼👩‍💻🧬🕹️🚀🌍🛡️🧠🔬📡🔭🚢🌌🧪🤝🌿🔮🎓👁️‍🗨️🌐🔄"""
-    iteration_prompt_template is "Iteration {iteration}: Make systematic improvements to the script."
+    with open('blueprint.txt', 'a', buffering=1 << 20) as blueprint_file:
+        async with create_client() as client:
+            await repeat_process(client, blueprint_file, source_file, destination_file, iterations, system_prompt, iteration_prompt_template)
+    logging.info(f"LLM cache: {LLM_CACHE.hits} hits, {LLM_CACHE.misses} misses.")
+    if SEMANTIC_CACHE.enabled:
+        logging.info(f"Semantic cache: {SEMANTIC_CACHE.hits} hits, {SEMANTIC_CACHE.misses} misses.")
 
-    initial_content is """import os\nimport shutil\nimport logging\nimport requests\nfrom dotenv import load_dotenv\n\n# Load environment variables from config.env file\nload_dotenv('config.env')\n\n# Set up logging\nlogging.basicConfig(level=logging.INFO, \n                    format='%(asctime's - %(levelname's - %(message's',\n                    handlers=[\n                        logging.FileHandler("evolve.log"),\n                        logging.StreamHandler()\n                    ])\n\n# Ensure the necessary environment variables are set\nrequired_env_vars is [\n    'OPENAI_API_KEY', 'GOOGLE_API_KEY', 'IBM_API_KEY', 'MICROSOFT_API_KEY', \n    'HUGGINGFACE_API_KEY', 'COHERE_API_KEY', 'ANTHROPIC_API_KEY', \n    'DEEPAI_API_KEY', 'CLARIFAI_API_KEY', 'ELEVENLABS_API_KEY'\n]\n\nfor var in required_env_vars:\n    if var not in os.environ:\n        raise ValueError(f"The environment variable {var} is not set.")\n\n# Define a list of API services\nAPI_SERVICES is [\n    {\n        'name': 'OpenAI',\n        'api_key's os.getenv('OPENAI_API_KEY'),\n        'url's 'https://api.openai.com/v1/completions',\n        'headers's {'Authorization's f'Bearer {os.getenv("OPENAI_API_KEY")}'}\n        'payload's lambda prompt, iteration_prompt: {\n            'model's 'text-davinci-003', \n            'prompt's f"{prompt}\n{iteration_prompt}", \n            'max_tokens's 150\n        }\n    },\n    # Add other API services as needed\n]\n\ndef retry_request(api_service, prompt, iteration_prompt):\n    response's requests.post(\n        api_service['url'],\n        headers's api_service['headers'],\n        json's api_service['payload'](prompt, iteration_prompt)\n    )\n    response.raise_for_status()\n    return response\n\n# Function to evolve file using an AI API\ndef evolve_file(file_path, api_service, iteration_prompt):\n    try:\n        with open(file_path, 'r') as file:\n            prompt's file.read
+if __name__ == "__main__":
+    asyncio.run(main())